@@ -185,6 +185,13 @@ _convert = {
                ('__lt__', _lt_from_ge)]
 }
 
+# The conversion functions are shared by every decorated class, so they are
+# renamed once here rather than on each call to total_ordering().
+for _conversions in _convert.values():
+    for _opname, _opfunc in _conversions:
+        _opfunc.__name__ = _opname
+del _conversions, _opname, _opfunc
+
 def total_ordering(cls):
     """Class decorator that fills in missing ordering methods"""
     # Find user-defined comparisons (not those inherited from object).
@@ -194,7 +201,6 @@ def total_ordering(cls):
     root = max(roots)       # prefer __lt__ to __le__ to __gt__ to __ge__
     for opname, opfunc in _convert[root]:
         if opname not in roots:
-            opfunc.__name__ = opname
             setattr(cls, opname, opfunc)
     return cls
 
@@ -445,9 +451,13 @@ class _HashedSeq(list):
     def __hash__(self):
         return self.hashvalue
 
+# Types whose instances cache their hash value (or have a cheap one) and
+# can therefore stand in for a single-argument key without a wrapper.
+_fasttypes = {int, str, frozenset, type(None)}
+
 def _make_key(args, kwds, typed,
              kwd_mark = (object(),),
-             fasttypes = {int, str},
+             fasttypes = _fasttypes,
              tuple=tuple, type=type, len=len):
     """Make a cache key from optionally typed positional and keyword arguments
 
@@ -526,6 +536,9 @@ def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
     # Constants shared by all lru cache instances:
     sentinel = object()          # unique object used to signal cache misses
     make_key = _make_key         # build a key from the function arguments
+    fasttypes = _fasttypes       # single arguments that serve as their own key
+    args_len = len               # builtins.len may be replaced by a cached one
+    arg_type = type              # local lookup, as it runs on every call
     PREV, NEXT, KEY, RESULT = 0, 1, 2, 3   # names for the link fields
 
     cache = {}
@@ -551,7 +564,11 @@ def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
         def wrapper(*args, **kwds):
             # Simple caching without ordering or size limit
             nonlocal hits, misses
-            key = make_key(args, kwds, typed)
+            if (not kwds and not typed and args_len(args) == 1
+                    and arg_type(args[0]) in fasttypes):
+                key = args[0]    # what make_key() would return, minus the call
+            else:
+                key = make_key(args, kwds, typed)
             result = cache_get(key, sentinel)
             if result is not sentinel:
                 hits += 1
@@ -566,7 +583,11 @@ def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
         def wrapper(*args, **kwds):
             # Size limited caching that tracks accesses by recency
             nonlocal root, hits, misses, full
-            key = make_key(args, kwds, typed)
+            if (not kwds and not typed and args_len(args) == 1
+                    and arg_type(args[0]) in fasttypes):
+                key = args[0]    # what make_key() would return, minus the call
+            else:
+                key = make_key(args, kwds, typed)
             with lock:
                 link = cache_get(key)
                 if link is not None:
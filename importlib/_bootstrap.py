@@ -33,15 +33,19 @@ _thread = None
 _warnings = None
 _weakref = None
 
+# sys.builtin_module_names as a set, filled in by _setup()
+_builtin_names = frozenset()
+
 # Import done by _install_external_importers()
 _bootstrap_external = None
 
 
 def _wrap(new, old):
     """Simple substitute for functools.update_wrapper."""
-    for replace in ['__module__', '__name__', '__qualname__', '__doc__']:
-        if hasattr(old, replace):
-            setattr(new, replace, getattr(old, replace))
+    new.__module__ = old.__module__
+    new.__name__ = old.__name__
+    new.__qualname__ = old.__qualname__
+    new.__doc__ = old.__doc__
     new.__dict__.update(old.__dict__)
 
 
@@ -411,7 +415,7 @@ def _verbose_message(message, *args, verbosity=1):
 def _requires_builtin(fxn):
     """Decorator to verify the named module is built-in."""
     def _requires_builtin_wrapper(self, fullname):
-        if fullname not in sys.builtin_module_names:
+        if fullname not in _builtin_names:
             raise ImportError(f'{fullname!r} is not a built-in module',
                               name=fullname)
         return fxn(self, fullname)
@@ -441,8 +445,8 @@ def _load_module_shim(self, fullname):
           "Python 3.12; use exec_module() instead")
     _warnings.warn(msg, DeprecationWarning)
     spec = spec_from_loader(fullname, self)
-    if fullname in sys.modules:
-        module = sys.modules[fullname]
+    module = sys.modules.get(fullname, _NEEDS_LOADING)
+    if module is not _NEEDS_LOADING:
         _exec(spec, module)
         return sys.modules[fullname]
     else:
@@ -840,10 +844,7 @@ def _load_unlocked(spec):
             else:
                 spec.loader.exec_module(module)
         except:
-            try:
-                del sys.modules[spec.name]
-            except KeyError:
-                pass
+            sys.modules.pop(spec.name, None)
             raise
         # Move the module to the end of sys.modules.
         # We don't ensure that the import-related module attributes get
@@ -851,7 +852,8 @@ def _load_unlocked(spec):
         # their own.
         module = sys.modules.pop(spec.name)
         sys.modules[spec.name] = module
-        _verbose_message('import {!r} # {!r}', spec.name, spec.loader)
+        if sys.flags.verbose:
+            _verbose_message('import {!r} # {!r}', spec.name, spec.loader)
     finally:
         spec._initializing = False
 
@@ -912,7 +914,7 @@ class BuiltinImporter:
     @staticmethod
     def create_module(spec):
         """Create a built-in module"""
-        if spec.name not in sys.builtin_module_names:
+        if spec.name not in _builtin_names:
             raise ImportError(f'{spec.name!r} is not a built-in module',
                               name=spec.name)
         return _call_with_frames_removed(_imp.create_builtin, spec)
@@ -1165,10 +1167,12 @@ class _ImportLockContext:
 
 def _resolve_name(name, package, level):
     """Resolve a relative module name to an absolute one."""
-    bits = package.rsplit('.', level - 1)
-    if len(bits) < level:
-        raise ImportError('attempted relative import beyond top-level package')
-    base = bits[0]
+    end = len(package)
+    for _ in range(level - 1):
+        end = package.rfind('.', 0, end)
+        if end < 0:
+            raise ImportError('attempted relative import beyond top-level package')
+    base = package[:end]
     return f'{base}.{name}' if name else base
 
 
@@ -1198,7 +1202,9 @@ def _find_spec(name, path, target=None):
     # sys.modules provides one.
     is_reload = name in sys.modules
     for finder in meta_path:
-        with _ImportLockContext():
+        # Same as _ImportLockContext, without a context manager per finder.
+        _imp.acquire_lock()
+        try:
             try:
                 find_spec = finder.find_spec
             except AttributeError:
@@ -1207,10 +1213,14 @@ def _find_spec(name, path, target=None):
                     continue
             else:
                 spec = find_spec(name, path, target)
+        finally:
+            _imp.release_lock()
         if spec is not None:
+            if is_reload:
+                return spec
             # The parent import may have already imported this module.
-            if not is_reload and name in sys.modules:
-                module = sys.modules[name]
+            module = sys.modules.get(name, _NEEDS_LOADING)
+            if module is not _NEEDS_LOADING:
                 try:
                     __spec__ = module.__spec__
                 except AttributeError:
@@ -1233,16 +1243,17 @@ def _sanity_check(name, package, level):
     """Verify arguments are "sane"."""
     if not isinstance(name, str):
         raise TypeError(f'module name must be str, not {type(name)}')
-    if level < 0:
+    # Absolute imports are the common case; they only need a name.
+    if level == 0:
+        if not name:
+            raise ValueError('Empty module name')
+    elif level < 0:
         raise ValueError('level must be >= 0')
-    if level > 0:
-        if not isinstance(package, str):
-            raise TypeError('__package__ not set to a string')
-        elif not package:
-            raise ImportError('attempted relative import with no known parent '
-                              'package')
-    if not name and level == 0:
-        raise ValueError('Empty module name')
+    elif not isinstance(package, str):
+        raise TypeError('__package__ not set to a string')
+    elif not package:
+        raise ImportError('attempted relative import with no known parent '
+                          'package')
 
 
 _ERR_MSG_PREFIX = 'No module named '
@@ -1250,7 +1261,7 @@ _ERR_MSG = _ERR_MSG_PREFIX + '{!r}'
 
 def _find_and_load_unlocked(name, import_):
     path = None
-    parent = name.rpartition('.')[0]
+    parent, _, child = name.rpartition('.')
     parent_spec = None
     if parent:
         if parent not in sys.modules:
@@ -1265,7 +1276,6 @@ def _find_and_load_unlocked(name, import_):
             msg = f'{_ERR_MSG_PREFIX} {name!r}; {parent!r} is not a package'
             raise ModuleNotFoundError(msg, name=name) from None
         parent_spec = parent_module.__spec__
-        child = name.rpartition('.')[2]
     spec = _find_spec(name, path)
     if spec is None:
         raise ModuleNotFoundError(f'{_ERR_MSG_PREFIX}{name!r}', name=name)
@@ -1419,7 +1429,10 @@ def __import__(name, globals=None, locals=None, fromlist=(), level=0):
         # Return up to the first dot in 'name'. This is complicated by the fact
         # that 'name' may be relative.
         if level == 0:
-            return _gcd_import(name.partition('.')[0])
+            dot = name.find('.')
+            if dot < 0:
+                return module
+            return _gcd_import(name[:dot])
         elif not name:
             return module
         else:
@@ -1450,15 +1463,17 @@ def _setup(sys_module, _imp_module):
     modules, those two modules must be explicitly passed in.
 
     """
-    global _imp, sys
+    global _imp, sys, _builtin_names
     _imp = _imp_module
     sys = sys_module
+    # The set of built-in modules is fixed for the life of the process.
+    _builtin_names = frozenset(sys.builtin_module_names)
 
     # Set up the spec for existing builtin/frozen modules.
     module_type = type(sys)
     for name, module in sys.modules.items():
         if isinstance(module, module_type):
-            if name in sys.builtin_module_names:
+            if name in _builtin_names:
                 loader = BuiltinImporter
             elif _imp.is_frozen(name):
                 loader = FrozenImporter
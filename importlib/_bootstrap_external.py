@@ -55,10 +55,11 @@ _CASE_INSENSITIVE_PLATFORMS_STR_KEY = 'win',
 _CASE_INSENSITIVE_PLATFORMS_BYTES_KEY = 'cygwin', 'darwin'
 _CASE_INSENSITIVE_PLATFORMS =  (_CASE_INSENSITIVE_PLATFORMS_BYTES_KEY
                                 + _CASE_INSENSITIVE_PLATFORMS_STR_KEY)
+_CASE_INSENSITIVE = sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS)
 
 
 def _make_relax_case():
-    if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
+    if _CASE_INSENSITIVE:
         if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS_STR_KEY):
             key = 'PYTHONCASEOK'
         else:
@@ -129,12 +130,19 @@ else:
                               for part in path_parts if part])
 
 
-def _path_split(path):
-    """Replacement for os.path.split()."""
-    i = max(path.rfind(p) for p in path_separators)
-    if i < 0:
-        return '', path
-    return path[:i], path[i + 1:]
+if _MS_WINDOWS:
+    def _path_split(path):
+        """Replacement for os.path.split()."""
+        i = max(map(path.rfind, path_separators))
+        if i < 0:
+            return '', path
+        return path[:i], path[i + 1:]
+
+else:
+    def _path_split(path):
+        """Replacement for os.path.split()."""
+        front, _, tail = path.rpartition(path_sep)
+        return front, tail
 
 
 def _path_stat(path):
@@ -168,6 +176,18 @@ def _path_isdir(path):
     return _path_is_mode_type(path, 0o040000)
 
 
+if _MS_WINDOWS and hasattr(_os, '_path_isfile'):
+    # A full stat() is overkill on Windows.  Use the simpler builtin
+    # functions that ntpath also uses, when they are available.
+    _path_isfile = _os._path_isfile
+
+    def _path_isdir(path):
+        """Replacement for os.path.isdir."""
+        if not path:
+            path = _os.getcwd()
+        return _os._path_isdir(path)
+
+
 if _MS_WINDOWS:
     def _path_isabs(path):
         """Replacement for os.path.isabs."""
@@ -203,8 +223,13 @@ def _write_atomic(path, data, mode=0o666):
     try:
         # We first write data to a temporary file, and then use os.replace() to
         # perform an atomic rename.
-        with _io.FileIO(fd, 'wb') as file:
-            file.write(data)
+        try:
+            # os.write() returns a byte count, so slice a view of bytes.
+            view = memoryview(data).cast('B')
+            while view:
+                view = view[_os.write(fd, view):]
+        finally:
+            _os.close(fd)
         _os.replace(path_tmp, path)
     except OSError:
         try:
@@ -471,6 +496,11 @@ BYTECODE_SUFFIXES = ['.pyc']
 # Deprecated.
 DEBUG_BYTECODE_SUFFIXES = OPTIMIZED_BYTECODE_SUFFIXES = BYTECODE_SUFFIXES
 
+# The key and result of the last cache_from_source() call that did not involve
+# sys.pycache_prefix.  Importing a module from source computes the same
+# bytecode path twice in a row: once for __cached__ and again in get_code().
+_last_bytecode_path = None, None
+
 def cache_from_source(path, debug_override=None, *, optimization=None):
     """Given the path to a .py file, return the path to its .pyc file.
 
@@ -496,22 +526,27 @@ def cache_from_source(path, debug_override=None, *, optimization=None):
             message = 'debug_override or optimization must be set to None'
             raise TypeError(message)
         optimization = '' if debug_override else 1
+    global _last_bytecode_path
     path = _os.fspath(path)
-    head, tail = _path_split(path)
-    base, sep, rest = tail.rpartition('.')
     tag = sys.implementation.cache_tag
     if tag is None:
         raise NotImplementedError('sys.implementation.cache_tag is None')
-    almost_filename = ''.join([(base if base else rest), sep, tag])
     if optimization is None:
         if sys.flags.optimize == 0:
             optimization = ''
         else:
             optimization = sys.flags.optimize
     optimization = str(optimization)
+    if optimization != '' and not optimization.isalnum():
+        raise ValueError(f'{optimization!r} is not alphanumeric')
+    key = path, tag, optimization
+    last_key, last_bytecode_path = _last_bytecode_path
+    if key == last_key and sys.pycache_prefix is None:
+        return last_bytecode_path
+    head, tail = _path_split(path)
+    base, sep, rest = tail.rpartition('.')
+    almost_filename = f'{base or rest}{sep}{tag}'
     if optimization != '':
-        if not optimization.isalnum():
-            raise ValueError(f'{optimization!r} is not alphanumeric')
         almost_filename = f'{almost_filename}.{_OPT}{optimization}'
     filename = almost_filename + BYTECODE_SUFFIXES[0]
     if sys.pycache_prefix is not None:
@@ -538,7 +573,9 @@ def cache_from_source(path, debug_override=None, *, optimization=None):
             head.lstrip(path_separators),
             filename,
         )
-    return _path_join(head, _PYCACHE, filename)
+    bytecode_path = _path_join(head, _PYCACHE, filename)
+    _last_bytecode_path = key, bytecode_path
+    return bytecode_path
 
 
 def source_from_cache(path):
@@ -646,9 +683,10 @@ def _check_name(method):
         _wrap = _bootstrap._wrap
     else:
         def _wrap(new, old):
-            for replace in ['__module__', '__name__', '__qualname__', '__doc__']:
-                if hasattr(old, replace):
-                    setattr(new, replace, getattr(old, replace))
+            new.__module__ = old.__module__
+            new.__name__ = old.__name__
+            new.__qualname__ = old.__qualname__
+            new.__doc__ = old.__doc__
             new.__dict__.update(old.__dict__)
 
     _wrap(_check_name_wrapper, method)
@@ -691,9 +729,8 @@ def _classify_pyc(data, name, exc_details):
     field is invalid. EOFError is raised when the data is found to be truncated.
 
     """
-    magic = data[:4]
-    if magic != MAGIC_NUMBER:
-        message = f'bad magic number in {name!r}: {magic!r}'
+    if not data.startswith(MAGIC_NUMBER):
+        message = f'bad magic number in {name!r}: {data[:4]!r}'
         _bootstrap._verbose_message('{}', message)
         raise ImportError(message, **exc_details)
     if len(data) < 16:
@@ -727,12 +764,15 @@ def _validate_timestamp_pyc(data, source_mtime, source_size, name,
     An ImportError is raised if the bytecode is stale.
 
     """
-    if _unpack_uint32(data[8:12]) != (source_mtime & 0xFFFFFFFF):
+    # The timestamp and source size are adjacent little-endian 32-bit
+    # fields, so decode both with a single conversion.
+    fields = int.from_bytes(data[8:16], 'little')
+    if (fields & 0xFFFFFFFF) != (source_mtime & 0xFFFFFFFF):
         message = f'bytecode is stale for {name!r}'
         _bootstrap._verbose_message('{}', message)
         raise ImportError(message, **exc_details)
     if (source_size is not None and
-        _unpack_uint32(data[12:16]) != (source_size & 0xFFFFFFFF)):
+        (fields >> 32) != (source_size & 0xFFFFFFFF)):
         raise ImportError(f'bytecode is stale for {name!r}', **exc_details)
 
 
@@ -794,14 +834,20 @@ def _code_to_hash_pyc(code, source_hash, checked=True):
     return data
 
 
+# tokenize, imported by decode_source() on first use.
+_tokenize = None
+
+
 def decode_source(source_bytes):
     """Decode bytes representing source code and return the string.
 
     Universal newline support is used in the decoding.
     """
-    import tokenize  # To avoid bootstrap issues.
+    global _tokenize
+    if _tokenize is None:
+        import tokenize as _tokenize  # To avoid bootstrap issues.
     source_bytes_readline = _io.BytesIO(source_bytes).readline
-    encoding = tokenize.detect_encoding(source_bytes_readline)
+    encoding = _tokenize.detect_encoding(source_bytes_readline)
     newline_decoder = _io.IncrementalNewlineDecoder(None, True)
     return newline_decoder.decode(source_bytes.decode(encoding[0]))
 
@@ -1329,8 +1375,8 @@ class ExtensionFileLoader(FileLoader, _LoaderBasics):
     def is_package(self, fullname):
         """Return True if the extension module is a package."""
         file_name = _path_split(self.path)[1]
-        return any(file_name == '__init__' + suffix
-                   for suffix in EXTENSION_SUFFIXES)
+        return (file_name.startswith('__init__')
+                and file_name[len('__init__'):] in EXTENSION_SUFFIXES)
 
     def get_code(self, fullname):
         """Return None as an extension module cannot create a code object."""
@@ -1620,6 +1666,11 @@ class PathFinder:
         return MetadataPathFinder.find_distributions(*args, **kwargs)
 
 
+# FileFinder's index records a subdirectory under this entry alongside the
+# loader suffixes found for the name; no suffix can contain a separator.
+_DIRECTORY_ENTRY = path_sep
+
+
 class FileFinder:
 
     """File-based finder.
@@ -1637,14 +1688,17 @@ class FileFinder:
         for loader, suffixes in loader_details:
             loaders.extend((suffix, loader) for suffix in suffixes)
         self._loaders = loaders
+        self._suffixes = tuple(suffix for suffix, _ in loaders)
         # Base (directory) path
         if not path or path == '.':
             self.path = _os.getcwd()
         else:
             self.path = _path_abspath(path)
         self._path_mtime = -1
-        self._path_cache = set()
-        self._relaxed_path_cache = set()
+        # Maps module names to a tuple of the loader suffixes found for them,
+        # plus _DIRECTORY_ENTRY for a subdirectory.
+        self._path_cache = {}
+        self._relaxed_path_cache = {}
 
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
@@ -1680,7 +1734,7 @@ class FileFinder:
         is_namespace = False
         tail_module = fullname.rpartition('.')[2]
         try:
-            mtime = _path_stat(self.path or _os.getcwd()).st_mtime
+            mtime = _path_stat(self.path or _os.getcwd()).st_mtime_ns
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
@@ -1693,8 +1747,11 @@ class FileFinder:
         else:
             cache = self._path_cache
             cache_module = tail_module
+        found = cache.get(cache_module)
+        if not found:
+            return None
         # Check if the module is the name of a directory (and thus a package).
-        if cache_module in cache:
+        if _DIRECTORY_ENTRY in found:
             base_path = _path_join(self.path, tail_module)
             for suffix, loader_class in self._loaders:
                 init_filename = '__init__' + suffix
@@ -1707,12 +1764,12 @@ class FileFinder:
                 is_namespace = _path_isdir(base_path)
         # Check for a file w/ a proper suffix exists.
         for suffix, loader_class in self._loaders:
-            try:
-                full_path = _path_join(self.path, tail_module + suffix)
-            except ValueError:
-                return None
-            _bootstrap._verbose_message('trying {}', full_path, verbosity=2)
-            if cache_module + suffix in cache:
+            if suffix in found:
+                try:
+                    full_path = _path_join(self.path, tail_module + suffix)
+                except ValueError:
+                    return None
+                _bootstrap._verbose_message('trying {}', full_path, verbosity=2)
                 if _path_isfile(full_path):
                     return self._get_spec(loader_class, fullname, full_path,
                                           None, target)
@@ -1726,33 +1783,71 @@ class FileFinder:
     def _fill_cache(self):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
+        suffixes = self._suffixes
+        # Windows users can import modules with case-insensitive file
+        # suffixes (for legacy reasons). Make the suffix lowercase here
+        # so it's done once instead of for every import. This is safe as
+        # the specified suffixes to check against are always specified in a
+        # case-sensitive manner.
+        lower_suffix = _MS_WINDOWS
+        # We store two cached versions, to handle runtime changes of the
+        # PYTHONCASEOK environment variable.
+        relax = _CASE_INSENSITIVE
+        index = {}
+        relaxed_index = {}
         try:
-            contents = _os.listdir(path or _os.getcwd())
+            with _os.scandir(path or _os.getcwd()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if lower_suffix:
+                        base, dot, suffix = name.partition('.')
+                        if dot:
+                            name = f'{base}.{suffix.lower()}'
+                    relaxed_name = name.lower() if relax else name
+                    # Index the entries by module name, so find_spec() rules
+                    # out a name with a single lookup before any stat().
+                    # Only dot-free names can be packages and only names
+                    # with a loader suffix can be modules, so only their
+                    # types are checked; the type usually comes with the
+                    # listing.
+                    try:
+                        if '.' not in name and entry.is_dir():
+                            index[name] = (
+                                index.get(name, ()) + (_DIRECTORY_ENTRY,))
+                            if relax:
+                                relaxed_index[relaxed_name] = (
+                                    relaxed_index.get(relaxed_name, ())
+                                    + (_DIRECTORY_ENTRY,))
+                        elif ((name.endswith(suffixes)
+                               or relaxed_name.endswith(suffixes))
+                              and entry.is_file()):
+                            for suffix in suffixes:
+                                if name.endswith(suffix):
+                                    stem = name[:-len(suffix)]
+                                    index[stem] = (
+                                        index.get(stem, ()) + (suffix,))
+                                if relax and relaxed_name.endswith(suffix):
+                                    stem = relaxed_name[:-len(suffix)]
+                                    relaxed_index[stem] = (
+                                        relaxed_index.get(stem, ())
+                                        + (suffix,))
+                    except OSError:
+                        pass
         except (FileNotFoundError, PermissionError, NotADirectoryError):
             # Directory has either been removed, turned into a file, or made
             # unreadable.
-            contents = []
-        # We store two cached versions, to handle runtime changes of the
-        # PYTHONCASEOK environment variable.
-        if not sys.platform.startswith('win'):
-            self._path_cache = set(contents)
-        else:
-            # Windows users can import modules with case-insensitive file
-            # suffixes (for legacy reasons). Make the suffix lowercase here
-            # so it's done once instead of for every import. This is safe as
-            # the specified suffixes to check against are always specified in a
-            # case-sensitive manner.
-            lower_suffix_contents = set()
-            for item in contents:
-                name, dot, suffix = item.partition('.')
-                if dot:
-                    new_name = f'{name}.{suffix.lower()}'
-                else:
-                    new_name = name
-                lower_suffix_contents.add(new_name)
-            self._path_cache = lower_suffix_contents
-        if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
-            self._relaxed_path_cache = {fn.lower() for fn in contents}
+            index = {}
+            relaxed_index = {}
+        # Most names share one of a handful of suffix combinations, so let
+        # them share the tuples too; the index then costs little more than
+        # a set of the names would.
+        shared = {}
+        for cache in (index, relaxed_index):
+            for stem, found in cache.items():
+                cache[stem] = shared.setdefault(found, found)
+        self._path_cache = index
+        if relax:
+            self._relaxed_path_cache = relaxed_index
 
     @classmethod
     def path_hook(cls, *loader_details):
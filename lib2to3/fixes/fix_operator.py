@@ -9,8 +9,6 @@ operator.repeat(obj, n)        -> operator.mul(obj, n)
 operator.irepeat(obj, n)       -> operator.imul(obj, n)
 """
 
-import collections.abc
-
 # Local imports
 from lib2to3 import fixer_base
 from lib2to3.fixer_util import Call, Name, String, touch_import
@@ -40,10 +38,21 @@ class FixOperator(fixer_base.BaseFix):
               power< %(methods)s trailer< %(obj)s > >
               """ % dict(methods=methods, obj=obj)
 
+    # Compiled patterns, shared by every instance (keyed by PATTERN).
+    _compiled = {}
+
+    def compile_pattern(self):
+        compiled = self._compiled.get(self.PATTERN)
+        if compiled is None:
+            super().compile_pattern()
+            self._compiled[self.PATTERN] = self.pattern, self.pattern_tree
+        else:
+            self.pattern, self.pattern_tree = compiled
+
     def transform(self, node, results):
         method = self._check_method(node, results)
         if method is not None:
-            return method(node, results)
+            return method(self, node, results)
 
     @invocation("operator.contains(%s)")
     def _sequenceIncludes(self, node, results):
@@ -74,6 +83,16 @@ class FixOperator(fixer_base.BaseFix):
     def _isNumberType(self, node, results):
         return self._handle_type2abc(node, results, "numbers", "Number")
 
+    _methods = {
+        "sequenceIncludes": _sequenceIncludes,
+        "isCallable": _isCallable,
+        "repeat": _repeat,
+        "irepeat": _irepeat,
+        "isSequenceType": _isSequenceType,
+        "isMappingType": _isMappingType,
+        "isNumberType": _isNumberType,
+    }
+
     def _handle_rename(self, node, results, name):
         method = results["method"][0]
         method.value = name
@@ -86,12 +105,10 @@ class FixOperator(fixer_base.BaseFix):
         return Call(Name("isinstance"), args, prefix=node.prefix)
 
     def _check_method(self, node, results):
-        method = getattr(self, "_" + results["method"][0].value)
-        if isinstance(method, collections.abc.Callable):
-            if "module" in results:
-                return method
-            else:
-                sub = (str(results["obj"]),)
-                invocation_str = method.invocation % sub
-                self.warning(node, "You should use '%s' here." % invocation_str)
+        method = self._methods[results["method"][0].value]
+        if "module" in results:
+            return method
+        sub = (str(results["obj"]),)
+        invocation_str = method.invocation % sub
+        self.warning(node, "You should use '%s' here." % invocation_str)
         return None
@@ -1394,6 +1394,19 @@ class TestLRU:
         self.assertEqual(square.cache_info().maxsize, 128)
         self.assertEqual(square.cache_info().currsize, 2)
 
+    def test_lru_single_argument_keys(self):
+        @self.module.lru_cache(maxsize=10)
+        def f(x):
+            return repr(x)
+
+        args = [1, (1,), 'a', ('a',), None, (None,),
+                frozenset({1}), (frozenset({1}),)]
+        for x in args:
+            self.assertEqual(f(x), repr(x))
+        for x in args:
+            self.assertEqual(f(x), repr(x))
+        self.assertEqual(f.cache_info(), (len(args), len(args), 10, len(args)))
+
     def test_lru_bug_35780(self):
         # C version of the lru_cache was not checking to see if
         # the user function call has already modified the cache
@@ -1731,6 +1744,51 @@ class TestLRU:
         with threading_helper.start_threads(threads):
             pass
 
+    @threading_helper.requires_working_threading()
+    def test_lru_cache_threaded_hits(self):
+        # Concurrent hits must neither recompute a cached value nor break
+        # a concurrent eviction.
+        n, m = 8, 1000
+        calls = []
+        @self.module.lru_cache(maxsize=2)
+        def f(x, y):
+            calls.append((x, y))
+            return 3 * x + y
+        self.assertEqual(f(0, 0), 0)
+
+        start = threading.Event()
+        errors = []
+        def hit():
+            start.wait(10)
+            try:
+                for _ in range(m):
+                    self.assertEqual(f(0, 0), 0)
+            except Exception as exc:
+                errors.append(exc)
+        def miss():
+            start.wait(10)
+            try:
+                for i in range(1, m):
+                    self.assertEqual(f(i, i), 4 * i)
+                    # Keep (0, 0) cached for the hitting threads
+                    self.assertEqual(f(0, 0), 0)
+            except Exception as exc:
+                errors.append(exc)
+
+        orig_si = sys.getswitchinterval()
+        support.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=hit) for k in range(n)]
+            threads.append(threading.Thread(target=miss))
+            with threading_helper.start_threads(threads):
+                start.set()
+        finally:
+            sys.setswitchinterval(orig_si)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(calls.count((0, 0)), 1)
+        self.assertEqual(f.cache_info().misses, m)
+
     def test_need_for_rlock(self):
         # This will deadlock on an LRU cache that uses a regular lock
 
@@ -1888,6 +1946,24 @@ class TestLRUPy(TestLRU, unittest.TestCase):
     def cached_staticmeth(x, y):
         return 3 * x + y
 
+    def test_lru_with_exceptions_stats_match_c(self):
+        # A call that raises still counts as a miss, as in the C version.
+        def func(i):
+            return 'abc'[i]
+        for maxsize in (0, 2, None):
+            infos = []
+            for module in (self.module, c_functools):
+                f = module.lru_cache(maxsize)(func)
+                for i in (0, 15, 0, 15):
+                    try:
+                        f(i)
+                    except IndexError:
+                        pass
+                infos.append(f.cache_info())
+            py_info, c_info = infos
+            self.assertEqual(py_info, c_info)
+            self.assertEqual(py_info.misses, 4 if maxsize == 0 else 3)
+
 
 class TestLRUC(TestLRU, unittest.TestCase):
     module = c_functools
@@ -176,6 +176,43 @@ class FinderTests(abc.FinderTests):
             found = self._find(finder, 'doesnotexist')
             self.assertEqual(found, self.NOT_FOUND)
 
+    def test_module_over_namespace_dir(self):
+        # A directory without __init__ does not hide a module of that name.
+        with util.create_modules('mod') as mapping:
+            os.mkdir(os.path.join(mapping['.root'], 'mod'))
+            loader = self.import_(mapping['.root'], 'mod')
+            self.assertEqual(loader.get_filename('mod'), mapping['mod'])
+
+    def test_dir_with_module_suffix(self):
+        with util.create_modules('blah') as mapping:
+            os.mkdir(os.path.join(mapping['.root'], 'mod.py'))
+            found = self._find(self.get_finder(mapping['.root']), 'mod')
+            self.assertEqual(found, self.NOT_FOUND)
+
+    def test_file_without_suffix(self):
+        with util.create_modules('blah') as mapping:
+            with open(os.path.join(mapping['.root'], 'mod'), 'w',
+                      encoding='utf-8'):
+                pass
+            found = self._find(self.get_finder(mapping['.root']), 'mod')
+            self.assertEqual(found, self.NOT_FOUND)
+
+    def test_deleted_entries(self):
+        # The directory listing is only refreshed when the directory's mtime
+        # changes, which may not happen on filesystems with coarse mtimes.
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            ns_dir = os.path.join(root, 'ns')
+            os.mkdir(ns_dir)
+            root_stat = os.stat(root)
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+            os.unlink(mapping['mod'])
+            os.rmdir(ns_dir)
+            os.utime(root, ns=(root_stat.st_atime_ns, root_stat.st_mtime_ns))
+            self.assertEqual(self._find(finder, 'mod'), self.NOT_FOUND)
+            self.assertEqual(self._find(finder, 'ns'), self.NOT_FOUND)
+
 
 class FinderTestsPEP451(FinderTests):
 
@@ -201,6 +238,13 @@ class FinderTestsPEP420(FinderTests):
             loader_portions = finder.find_loader(name)
             return loader_portions[0] if loader_only else loader_portions
 
+    def test_namespace_dir(self):
+        with util.create_modules('blah') as mapping:
+            ns_dir = os.path.join(mapping['.root'], 'ns')
+            os.mkdir(ns_dir)
+            found = self._find(self.get_finder(mapping['.root']), 'ns')
+            self.assertEqual(found, (None, [ns_dir]))
+
 
 (Frozen_FinderTestsPEP420,
  Source_FinderTestsPEP420